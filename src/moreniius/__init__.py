@@ -1,4 +1,5 @@
 from .moreniius import MorEniius
+from .navigator import NexusStructureNavigator
 from .nexus_structure import load_instr, to_nexus_structure
 
-__all__ = ['MorEniius', 'load_instr', 'to_nexus_structure']
+__all__ = ['MorEniius', 'NexusStructureNavigator', 'load_instr', 'to_nexus_structure']
@@ -95,34 +95,69 @@ def diskchopper_translator(nxinstance):
     return nxinstance.make_nx(NXdisk_chopper, slit_edges=NXfield(nx_slit_edges, units='degrees'), **resolve_parameter_links(pars))
 
 
+def _ellipse_width(minor, distance, at):
+    from numpy import sqrt
+    major = sqrt((distance / 2) ** 2 + minor ** 2)
+    return 0 if abs(at) > major else minor * sqrt(1 - (at / major) ** 2)
+
+
+def _ellipse_vertices_faces(p: dict, n: int):
+    """Ring vertices and side faces for an elliptic guide with midpoint-specified dimensions
+
+    Produces (n+1)*4 vertices and n*4 quadrilateral faces; the guide entry and exit
+    openings are intentionally not represented.
+    """
+    from numpy import arange
+    rings = arange(n + 1) / n
+    faces = []
+    if all(isinstance(v, (int, float)) for v in p.values()):
+        # all-constant parameters: evaluate both ellipse sweeps as broadcast array
+        # expressions instead of per-ring Python arithmetic
+        from numpy import abs as np_abs, empty, sqrt, zeros_like
+
+        def widths(minor, distance, at):
+            major = sqrt((distance / 2) ** 2 + minor ** 2)
+            out = zeros_like(at)
+            inside = np_abs(at) <= major
+            out[inside] = minor * sqrt(1 - (at[inside] / major) ** 2)
+            return out
+
+        w = widths(p['xw'] / 2, p['xi'] + p['l'] + p['xo'], p['xi'] / 2 + (rings - 0.5) * p['l'] - p['xo'] / 2)
+        h = widths(p['yw'] / 2, p['yi'] + p['l'] + p['yo'], p['yi'] / 2 + (rings - 0.5) * p['l'] - p['yo'] / 2)
+        table = empty((n + 1, 4, 3))
+        table[..., 2] = (rings * p['l'])[:, None]
+        table[:, 0, 0], table[:, 0, 1] = -w, -h
+        table[:, 1, 0], table[:, 1, 1] = -w, h
+        table[:, 2, 0], table[:, 2, 1] = w, h
+        table[:, 3, 0], table[:, 3, 1] = w, -h
+        vertices = table.reshape(-1, 3).tolist()
+    else:
+        # one or more parameters is symbolic; build the rings one at a time
+        vertices = []
+        for x in rings:
+            w = _ellipse_width(p['xw'] / 2, p['xi'] + p['l'] + p['xo'], p['xi'] / 2 + (x - 0.5) * p['l'] - p['xo'] / 2)
+            h = _ellipse_width(p['yw'] / 2, p['yi'] + p['l'] + p['yo'], p['yi'] / 2 + (x - 0.5) * p['l'] - p['yo'] / 2)
+            z = x * p['l']
+            vertices.extend([[-w, -h, z], [-w, h, z], [w, h, z], [w, -h, z]])
+
+    for i in range(n):
+        j0, j1, j2, j3, j4, j5, j6, j7 = [4 * i + k for k in range(8)]
+        faces.extend([[j0, j1, j5, j4], [j1, j2, j6, j5], [j2, j3, j7, j6], [j3, j0, j4, j7]])
+    return vertices, faces
+
+
 def elliptic_guide_gravity_translator(nxinstance):
     from nexusformat.nexus import NXguide
-    from numpy import arange, sqrt
     from moreniius.nxoff import NXoff
     if not '"mid"' == nxinstance.obj.get_parameter('dimensionsAt'):
         log.warn('Only midpoint geometry supported by Elliptic_guide_gravity translator')
         log.info(f'The current guide has {nxinstance.obj.get_parameter("dimensionsAt")} specified')
 
-    def ellipse_width(minor, distance, at):
-        major = sqrt((distance / 2) ** 2 + minor ** 2)
-        return 0 if abs(at) > major else minor * sqrt(1 - (at / major) ** 2)
-
     pars = dict(xw='xwidth', xi='linxw', xo='loutxw', yw='yheight', yi='linyh', yo='loutyh', l='l')
     p = {k: nxinstance.parameter(v) for k, v in pars.items()}
-    n = 10
-    rings = arange(n + 1) / n
-    faces, vertices = [], []
-    for x in rings:
-        w = ellipse_width(p['xw'] / 2, p['xi'] + p['l'] + p['xo'], p['xi'] / 2 + (x - 0.5) * p['l'] - p['xo'] / 2)
-        h = ellipse_width(p['yw'] / 2, p['yi'] + p['l'] + p['yo'], p['yi'] / 2 + (x - 0.5) * p['l'] - p['yo'] / 2)
-        z = x * p['l']
-        vertices.extend([[-w, -h, z], [-w, h, z], [w, h, z], [w, -h, z]])
-
     # These are only the guide faces (that is, the inner faces of the sides of the guide housing)
     # The entry and exit are not guide faces and therefore are NOT represented here!
-    for i in range(n):
-        j0, j1, j2, j3, j4, j5, j6, j7 = [4 * i + k for k in range(8)]
-        faces.extend([[j0, j1, j5, j4], [j1, j2, j6, j5], [j2, j3, j7, j6], [j3, j0, j4, j7]])
+    vertices, faces = _ellipse_vertices_faces(p, 10)
 
     nx_vertices = [[nxinstance.expr2nx(expr) for expr in vector] for vector in vertices]
     nx_faces = [[nxinstance.expr2nx(expr) for expr in face] for face in faces]
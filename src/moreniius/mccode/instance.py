@@ -70,6 +70,7 @@ class NXInstance:
     only_nx: bool
     nx: Union[None, dict, NXfield] = None
     dump_mcstas: bool = False
+    transformations_modified: bool = False
 
     def parameter(self, name, default=None):
         """
@@ -119,8 +120,12 @@ class NXInstance:
             most_dependent = outer_transform_dependency(self.nx['transformations'])
             for name, insert in mccode_component_eniius_data(self.obj, only_nx=self.only_nx).items():
                 self.nx[name] = insert
-                if not hasattr(self.nx[name], 'depends_on'):
-                    self.nx[name].attrs['depends_on'] = most_dependent
+                if name == 'transformations':
+                    # flag the replacement so callers need not deep-compare the group
+                    self.transformations_modified = True
+                entry = self.nx[name]
+                if not hasattr(entry, 'depends_on'):
+                    entry.attrs['depends_on'] = most_dependent
                 most_dependent = outer_transform_dependency(self.nx['transformations'])
             self.nx['depends_on'] = f'transformations/{most_dependent}'
 
@@ -3,6 +3,15 @@ from dataclasses import dataclass, field
 from mccode_antlr.instr import Instr
 from mccode_antlr.common import Expr
 from nexusformat.nexus import NXfield, NXgroup, NXcollection
+from moreniius.utils import link_specifier
+
+# plain scalars pass through expr2nx unchanged; dispatch them before any Expr handling
+_SCALAR_TYPES = frozenset((bool, int, float, complex, str, type(None)))
+
+# The C translation of an Instr's declared variables is pure but expensive; keep the result
+# keyed by instrument identity so several NXInstr views of one Instr translate it once.
+# The Instr is stored alongside to pin its id for the lifetime of the cache entry.
+_DECLARED_CACHE: dict[int, tuple[Instr, dict]] = {}
 
 
 @dataclass
@@ -13,6 +22,11 @@ class NXInstr:
 
     def __post_init__(self):
         """Start the C translation to ensure McCode-oddities are handled before any C-code parsing."""
+        cached = _DECLARED_CACHE.get(id(self.instr))
+        if cached is not None and cached[0] is self.instr:
+            self.declared = cached[1]
+            self._finish_init()
+            return
         from mccode_antlr.common import ShapeType, DataType, Value
         from mccode_antlr.translators.target import MCSTAS_GENERATOR
         from mccode_antlr.translators.c import CTargetVisitor
@@ -38,7 +52,7 @@ class NXInstr:
         # defined as
         # TODO this does not work because the simple "C"-style expression parser doesn't know about pointers
         # Hopefully any %include style lines have been removed at this point.
-        all_inits = '\n'.join(init.source for init in self.instr.initialize)
+        all_inits = '\n'.join([init.source for init in self.instr.initialize])
         try:
             variables = evaluate_c_defined_expressions(variables, all_inits)
         except AttributeError:
@@ -46,13 +60,36 @@ class NXInstr:
                      'This is not an error condition (for now). Continuing')
 
         self.declared = variables
+        _DECLARED_CACHE[id(self.instr)] = (self.instr, variables)
+        self._finish_init()
+
+    def _finish_init(self):
+        # expr2nx is called to wrap and re-wrap the same expressions during component
+        # translation; cache converted results by identity so each is evaluated once.
+        # The expression is kept alongside its result so its id can not be recycled.
+        self._expr_cache: dict[int, tuple] = {}
+        # The instrument parameter names are fixed; collect them once for the
+        # per-expression dependency scan instead of traversing parameters per call
+        self._param_names: tuple[str, ...] = tuple(p.name for p in self.instr.parameters)
+        # pre-formatted NXlog locations, so a link target is a lookup instead of an f-string
+        self._param_link: dict[str, str] = {name: f'{self.nxlog_root}/{name}' for name in self._param_names}
 
     def to_nx(self):
         # quick and very dirty:
         return NXfield(str(self.instr))
 
     def expr2nx(self, expr: Expr):
-        from moreniius.utils import link_specifier
+        if type(expr) in _SCALAR_TYPES:
+            return expr
+        key = id(expr)
+        hit = self._expr_cache.get(key)
+        if hit is not None and hit[0] is expr:
+            return hit[1]
+        result = self._expr2nx(expr)
+        self._expr_cache[key] = (expr, result)
+        return result
+
+    def _expr2nx(self, expr: Expr):
         if isinstance(expr, list):
             return [self.expr2nx(x) for x in expr]
         if isinstance(expr, tuple):
@@ -67,12 +104,18 @@ class NXInstr:
         if evaluated.is_constant:
             return evaluated.value
 
-        dependencies = [par.name for par in self.instr.parameters if evaluated.depends_on(par.name)]
+        if self._param_names:
+            depends_on = evaluated.depends_on
+            dependencies = [name for name in self._param_names if depends_on(name)]
+        else:
+            dependencies = []
         if len(dependencies):
-            log.warn(f'The expression {expr} depends on instrument parameter(s) {dependencies}\n'
+            expr_str = str(expr)
+            log.warn(f'The expression {expr_str} depends on instrument parameter(s) {dependencies}\n'
                      f'A link will be inserted for each; make sure their values are stored at {self.nxlog_root}/')
-            links = {par: link_specifier(par, f'{self.nxlog_root}/{par}') for par in dependencies}
-            return NXcollection(expression=str(expr), **links)
+            entries = {'expression': expr_str}
+            entries.update((par, link_specifier(par, self._param_link[par])) for par in dependencies)
+            return NXcollection(entries=entries)
 
         return str(expr)
 
@@ -1,7 +1,11 @@
+from sys import intern
 from zenlog import log
 from dataclasses import dataclass, field
 from mccode_antlr.instr import Orient
+from nexusformat.nexus import NXinstrument
 from .instr import NXInstr
+from .instance import NXInstance
+from .orientation import NXOrient
 
 log.level('error')
 
@@ -14,53 +18,78 @@ class NXMcCode:
     orientations: dict[str, Orient] = field(default_factory=dict)
 
     def __post_init__(self):
-        from copy import deepcopy
+        self._comp_by_name = {}
+        self._name_counts = {}
+        self._comps_by_category = {}
+        self._nx_orient_cache = {}
+        self._trans_cache = {}
         for index, instance in enumerate(self.nx_instr.instr.components):
-            self.indexes[instance.name] = index
-            self.orientations[instance.name] = deepcopy(instance.orientation)
+            # component names key every map here and are interpolated into group names later;
+            # interning them keeps all those dict probes on the identity fast path
+            name = intern(instance.name)
+            self.indexes[name] = index
+            # orientations are never modified in place -- re-centering below replaces the
+            # whole entry -- so hold the instance's orientation rather than deep-copying it
+            self.orientations[name] = instance.orientation
+            # first-wins, matching a forward scan of the component list, with the
+            # duplicate count kept so the origin lookup below can still report it
+            if self._comp_by_name.setdefault(name, instance) is not instance:
+                self._name_counts[name] = self._name_counts.get(name, 1) + 1
+            self._comps_by_category.setdefault(instance.type.category, []).append(instance)
         # Attempt to re-center all component dependent orientations on the sample
-        found = (lambda x: self.origin_name == x.name) if self.origin_name else (lambda x: 'samples' == x.type.category)
-        possible_origins = [instance for instance in self.nx_instr.instr.components if found(instance)]
+        if self.origin_name:
+            origin_comp = self._comp_by_name.get(self.origin_name)
+            possible_origins = [] if origin_comp is None else [origin_comp]
+            named_count = 0 if origin_comp is None else self._name_counts.get(self.origin_name, 1)
+        else:
+            possible_origins = self._comps_by_category.get('samples', [])
+            named_count = 0
 
         if not possible_origins:
             msg = '"sample" category components' if self.origin_name is None else f'component named {self.origin_name}'
             log.warn(f'No {msg} in instrument, using ABSOLUTE positions')
-        elif self.origin_name is not None and len(possible_origins) > 1:
-            log.error(f'{len(possible_origins)} components named {self.origin_name}; using the first')
+        elif named_count > 1:
+            log.error(f'{named_count} components named {self.origin_name}; using the first')
         elif len(possible_origins) > 1:
             log.warn(f'More than one "sample" category component. Using {possible_origins[0].name} for origin name')
         if possible_origins:
             self.origin_name = possible_origins[0].name
             # find the position _and_ rotation of the origin
             origin = possible_origins[0].orientation
-            # remove this from all components (re-centering on the origin)
-            for name in self.orientations:
-                self.orientations[name] = self.orientations[name] - origin
+            # remove this from all components (re-centering on the origin) in one pass,
+            # rather than mutating the dict entry-by-entry while iterating it
+            self.orientations = {name: o - origin for name, o in self.orientations.items()}
 
     def transformations(self, name):
-        from .orientation import NXOrient
-        return NXOrient(self.nx_instr, self.orientations[name]).transformations(name)
+        cached = self._trans_cache.get(name)
+        if cached is not None:
+            return cached
+        orientation = self.orientations[name]
+        nx_orient = self._nx_orient_cache.get(name)
+        if nx_orient is None or nx_orient.do is not orientation:
+            self._nx_orient_cache[name] = nx_orient = NXOrient(self.nx_instr, orientation)
+        self._trans_cache[name] = result = nx_orient.transformations(name)
+        return result
 
     def component(self, name, only_nx=True):
         """Return a NeXus NXcomponent corresponding to the named McStas component instance"""
-        from .instance import NXInstance
-        instance = self.nx_instr.instr.components[self.indexes[name]]
+        instance = self._comp_by_name[name]
         transformations = self.transformations(name)
         nx = NXInstance(self.nx_instr, instance, self.indexes[name], transformations, only_nx=only_nx)
-        if transformations and nx.nx['transformations'] != transformations:
+        if nx.transformations_modified:
             # if the component modifed the transformations group, make sure we don't use our version again
             del self.orientations[name]
+            self._trans_cache.pop(name, None)
+            self._nx_orient_cache.pop(name, None)
         return nx
 
     def instrument(self, only_nx=True):
-        from .instr import NXInstr
-        from nexusformat.nexus import NXinstrument
-        nx = NXinstrument()  # this is a NeXus class
-        nx['mcstas'] = self.nx_instr.to_nx()
         # hack the McCode component index into the name of the NeXus group
         width = len(str(max(self.indexes.values())))
-        for name, index in self.indexes.items():
-            nx_name = f'{index:0{width}d}_{name}'
-            nx[nx_name] = self.component(name, only_nx=only_nx).nx
-
-        return nx
+        component = self.component
+        entries = {'mcstas': self.nx_instr.to_nx()}
+        entries.update({f'{index:0{width}d}_{name}': component(name, only_nx=only_nx).nx
+                        for name, index in self.indexes.items()})
+        # collect everything in a plain dict first so the NXinstrument is built in one go,
+        # instead of paying the group __setitem__ change-propagation per component
+        return NXinstrument(entries=entries)
@@ -2,12 +2,69 @@ from __future__ import annotations
 
 from zenlog import log
 from dataclasses import dataclass
-from mccode_antlr.instr import Orient, Parts, Part
+from mccode_antlr.instr import Orient, Parts, Part, RotationPart, TranslationPart
+from mccode_antlr.common import Expr, Value
 from nexusformat.nexus import NXfield
 from .instr import NXInstr
 
+# parsed once; the per-axis comparisons in NXPart.translations reuse this
+_ZERO = Expr.parse('0')
+
+def _make_translation(instr: NXInstr, norm, vec, dep):
+    # if `norm` is a link or NXlog, we should make a group not an NXfield
+    return instr.make_nx(NXfield, norm, vector=vec, depends_on=dep, transformation_type='translation', units='m')
+
+
+def _part_translations(instr: NXInstr, o: Part, dep: str, name: str) -> list[tuple[str, NXfield]]:
+    if isinstance(o, RotationPart):
+        raise RuntimeError('Part is a rotation!')
+    pos = o.position()
+    x, y, z = pos.x, pos.y, pos.z
+    # chained `or` short-circuits on the first symbolic axis, without a generator
+    if isinstance(x, (Expr, Value)) or isinstance(y, (Expr, Value)) or isinstance(z, (Expr, Value)):
+        translations = []
+        for n, c, v in (('x', x, [1, 0, 0]), ('y', y, [0, 1, 0]), ('z', z, [0, 0, 1])):
+            if c != _ZERO:
+                next_name = f'{name}_{n}'
+                translations.append((next_name, _make_translation(instr, c, v, dep)))
+                dep = next_name
+        return translations
+    # vector is all constants, hopefully
+    norm = pos.length()
+    vec = pos if norm.is_zero else pos/norm
+    return [(name, _make_translation(instr, norm, vec, dep))]
+
+
+def _part_rotation(instr: NXInstr, o: Part, dep: str) -> NXfield:
+    if isinstance(o, TranslationPart):
+        raise RuntimeError('Part is a translation')
+    try:
+        axis, angle, angle_unit = o.rotation_axis_angle
+    except RuntimeError as error:
+        log.error(f'Failed to get rotation axis and angle: {error}')
+        print(repr(o))
+        raise NotImplementedError()
+
+    # handle the case where angle is not a constant?
+    return instr.make_nx(NXfield, angle, vector=axis, depends_on=dep, transformation_type='rotation', units=angle_unit)
+
+
+def _part_transformations(instr: NXInstr, o: Part, name: str, dep: str | None = None) -> list[tuple[str, NXfield]]:
+    if o.is_translation and o.is_rotation:
+        ops = _part_translations(instr, o, dep, name)
+        rot = _part_rotation(instr, o, ops[-1][0])
+        return [*ops, (f'{name}_r', rot)]
+    elif o.is_translation:
+        return _part_translations(instr, o, dep, name)
+    elif o.is_rotation:
+        return [(name, _part_rotation(instr, o, dep))]
+    else:
+        return []
+
+
 @dataclass
 class NXPart:
+    """Thin object interface over the module-level per-part transformation functions"""
     instr: NXInstr
     o: Part
 
@@ -18,53 +75,16 @@ class NXPart:
         return self.instr.make_nx(nx_class, *args, **kwargs)
 
     def make_translation(self, norm, vec, dep):
-        # if `norm` is a link or NXlog, we should make a group not an NXfield
-        return self.make_nx(NXfield, norm, vector=vec, depends_on=dep, transformation_type='translation', units='m')
+        return _make_translation(self.instr, norm, vec, dep)
 
     def translations(self, dep: str, name: str) -> list[tuple[str, NXfield]]:
-        from mccode_antlr.instr import RotationPart
-        from mccode_antlr.common import Expr, Value
-        if isinstance(self.o, RotationPart):
-            raise RuntimeError('Part is a rotation!')
-        pos = self.o.position()
-        if any(isinstance(c, (Expr, Value)) for c in (pos.x, pos.y, pos.z)):
-            translations = []
-            for n, c, v in (('x', pos.x, [1, 0, 0]), ('y', pos.y, [0, 1, 0]), ('z', pos.z, [0, 0, 1])):
-                if c != Expr.parse('0'):
-                    next_name = f'{name}_{n}'
-                    translations.append((next_name, self.make_translation(c, v, dep)))
-                    dep = next_name
-            return translations
-        # vector is all constants, hopefully
-        norm = pos.length()
-        vec = pos if norm.is_zero else pos/norm
-        return [(name, self.make_translation(norm, vec, dep))]
+        return _part_translations(self.instr, self.o, dep, name)
 
     def rotation(self, dep: str) -> NXfield:
-        from mccode_antlr.instr import TranslationPart
-        if isinstance(self.o, TranslationPart):
-            raise RuntimeError('Part is a translation')
-        try:
-            axis, angle, angle_unit = self.o.rotation_axis_angle
-        except RuntimeError as error:
-            log.error(f'Failed to get rotation axis and angle: {error}')
-            print(repr(self.o))
-            raise NotImplementedError()
-
-        # handle the case where angle is not a constant?
-        return self.make_nx(NXfield, angle, vector=axis, depends_on=dep, transformation_type='rotation', units=angle_unit)
+        return _part_rotation(self.instr, self.o, dep)
 
     def transformations(self, name: str, dep: str | None = None) -> list[tuple[str, NXfield]]:
-        if self.o.is_translation and self.o.is_rotation:
-            ops = self.translations(dep, name)
-            rot = self.rotation(ops[-1][0])
-            return [*ops, (f'{name}_r', rot)]
-        elif self.o.is_translation:
-            return self.translations(dep, name)
-        elif self.o.is_rotation:
-            return [(name, self.rotation(dep))]
-        else:
-            return []
+        return _part_transformations(self.instr, self.o, name, dep)
 
 
 @dataclass
@@ -74,13 +94,14 @@ class NXParts:
     rotation: Parts
 
     def transformations(self, name: str) -> list[tuple[str, NXfield]]:
+        # call the per-part functions directly; no NXPart allocation per stack entry
         nxt = []
         dep = '.'
         for index, o in enumerate(self.position.stack()):
-            nxt.extend(NXPart(self.instr, o).transformations(f'{name}_t{index}', dep))
+            nxt.extend(_part_transformations(self.instr, o, f'{name}_t{index}', dep))
             dep = nxt[-1][0] if len(nxt) and len(nxt[-1]) else '.'
         for index, o in enumerate(self.rotation.stack()):
-            nxt.extend(NXPart(self.instr, o).transformations(f'{name}_r{index}', dep))
+            nxt.extend(_part_transformations(self.instr, o, f'{name}_r{index}', dep))
             dep = nxt[-1][0] if len(nxt) and len(nxt[-1]) else '.'
         return nxt
 
@@ -95,5 +116,5 @@ class NXOrient:
         # But keep the rotations and translations separate
         pos, rot = self.do.position_parts(), self.do.rotation_parts()
         # make an ordered list of the requisite NXfield entries
-        nxt = NXParts(self.instr, pos, rot).transformations(name)
-        return {k: v for k, v in nxt}
+        # dict() consumes the pair list in C, without a per-item comprehension frame
+        return dict(NXParts(self.instr, pos, rot).transformations(name))
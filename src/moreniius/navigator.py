@@ -0,0 +1,281 @@
+"""Navigate the JSON-compatible 'NeXus Structure' dictionaries produced by this package.
+
+The ESS file-writer consumes a nested dictionary 'NeXus Structure', as produced by
+`moreniius.writer.Writer.to_nexus_structure`. Checking the contents of such a structure by hand
+requires repeatedly scanning lists of child dictionaries, so this module provides a small
+navigator class with path-based access, e.g., `nav['entry/instrument/mon0/@NX_class']`.
+"""
+from __future__ import annotations
+from collections import deque
+from functools import lru_cache
+from sys import intern
+
+
+@lru_cache(maxsize=1024)
+def _parse(path: str) -> tuple[str, ...]:
+    """The interned non-empty segments of a path, cached so repeated lookups skip the split
+
+    Interned segments hash once and compare by identity in the dictionary probes below.
+    """
+    return tuple(intern(name) for name in path.split('/') if name)
+
+
+# shared empty default for children/attributes probes: leaves no longer allocate
+# a fresh empty list per node during whole-tree walks
+_EMPTY: tuple = ()
+
+
+def _node_name(node: dict) -> str | None:
+    """The name of a group node, or the config name of a dataset or link node"""
+    name = node.get('name')
+    if name is None:
+        name = node.get('config', {}).get('name')
+    return name
+
+
+class NexusStructureNavigator:
+    """Wraps one node of a NeXus Structure dictionary to provide path-based navigation
+
+    Paths are '/'-separated group, dataset or link names, with an optional final
+    '@attribute_name' element selecting a named attribute dictionary, e.g.,
+    'entry/instrument/mon0/@NX_class'. Indexing by a group name returns a new navigator
+    wrapping the named child; indexing by an attribute name returns the attribute dictionary.
+    """
+    # chained access creates a navigator per visited node; slots keep them small
+    # and make the frequent structure/path/cache reads C-level slot lookups
+    __slots__ = ('structure', 'path', '_root', '_nav_map', '_group_maps', '_attr_maps',
+                 '_rev', '_fwd', '_resolved', '_by_name_all', '_by_attr_all')
+
+    def __init__(self, structure: dict, path: str = '', root: NexusStructureNavigator | None = None):
+        self.structure = structure
+        self.path = path
+        # the root navigator owns every cache shared across one structure; child
+        # navigators alias them so any navigator resolves against the same state
+        self._root = self if root is None else root
+        if root is None:
+            # one navigator per wrapped node, so any route to a node -- chained or
+            # slash-path -- yields the same wrapper instance
+            self._nav_map: dict[int, NexusStructureNavigator] = {id(structure): self}
+            # name->child maps per visited group, keyed by group identity, so each
+            # group's children list is scanned at most once
+            self._group_maps: dict[int, dict] = {}
+            # name->attribute maps, built and shared the same way as the child maps
+            self._attr_maps: dict[int, dict] = {}
+            # The forward (path->node) and reverse (id->path) indexes are built in one
+            # walk on first use, so wrapping a structure to read a single path does not
+            # pay for a full-tree traversal
+            self._rev: dict[int, str] | None = None
+            self._fwd: dict[str, dict] | None = None
+        else:
+            self._nav_map = root._nav_map
+            self._group_maps = root._group_maps
+            self._attr_maps = root._attr_maps
+            self._nav_map.setdefault(id(structure), self)
+        self._resolved: dict[str, object] = {}
+        # Inverted name->[nodes] indexes for find_all, built lazily on first use
+        self._by_name_all: dict[str, list[dict]] | None = None
+        self._by_attr_all: dict[str, list[dict]] | None = None
+
+    def _ensure_path_indexes(self) -> NexusStructureNavigator:
+        """Build the root's path indexes if not yet built, returning the root"""
+        root = self._root
+        if root._rev is None:
+            root._rev, root._fwd = root._build_path_indexes()
+        return root
+
+    def _build_path_indexes(self) -> tuple[dict[int, str], dict[str, dict]]:
+        # explicit stack rather than recursion: no frame per node, no recursion-depth limit
+        rev = {id(self.structure): self.path}
+        fwd = {self.path: self.structure}
+        # the walk below indexes the attributes of every child; the root node's own
+        # attributes must be indexed here or non-raising lookups would miss them
+        for attr in self.structure.get('attributes') or _EMPTY:
+            if 'name' in attr:
+                attr_path = f'{self.path}/@{attr["name"]}'
+                rev[id(attr)] = attr_path
+                fwd[attr_path] = attr
+        stack = deque([(self.structure, self.path)])
+        while stack:
+            node, path = stack.pop()
+            for child in node.get('children') or _EMPTY:
+                name = _node_name(child)
+                if name is None:
+                    # nameless nodes (e.g. f144/ev44 stream modules) have no path of
+                    # their own: indexing them would shadow or mislabel the parent,
+                    # so they stay out of both indexes but are still descended
+                    stack.append((child, path))
+                    continue
+                child_path = f'{path}/{name}'
+                rev[id(child)] = child_path
+                fwd[child_path] = child
+                for attr in child.get('attributes') or _EMPTY:
+                    if 'name' in attr:
+                        attr_path = f'{child_path}/@{attr["name"]}'
+                        rev[id(attr)] = attr_path
+                        fwd[attr_path] = attr
+                stack.append((child, child_path))
+        return rev, fwd
+
+    def get_path(self, element) -> str | None:
+        """Return the path of a node or attribute dictionary held by this structure, or None
+
+        The lookup is by object identity, so the element must be the dictionary contained in
+        the structure, not a copy of it.
+        """
+        return self._ensure_path_indexes()._rev.get(id(element))
+
+    def _children_by_name(self, node: dict | None = None) -> dict[str, dict]:
+        if node is None:
+            node = self.structure
+        gid = id(node)
+        by_name = self._group_maps.get(gid)
+        if by_name is None:
+            # interned keys pair with the interned path segments from _parse, so the
+            # probe's string comparison short-circuits on identity
+            by_name = {intern(name): c for c in node.get('children') or _EMPTY if (name := _node_name(c)) is not None}
+            self._group_maps[gid] = by_name
+        return by_name
+
+    def _attrs_by_name(self, node: dict | None = None) -> dict[str, dict]:
+        if node is None:
+            node = self.structure
+        gid = id(node)
+        by_name = self._attr_maps.get(gid)
+        if by_name is None:
+            by_name = {intern(a['name']): a for a in node.get('attributes') or _EMPTY if 'name' in a}
+            self._attr_maps[gid] = by_name
+        return by_name
+
+    def _wrap(self, node: dict, path: str) -> 'NexusStructureNavigator':
+        nav = self._nav_map.get(id(node))
+        if nav is None:
+            # the constructor registers the new navigator in the shared map
+            nav = NexusStructureNavigator(node, path=path, root=self._root)
+        return nav
+
+    def _resolve_raw(self, path: str) -> tuple[tuple[str, ...], str, dict | None]:
+        """Resolve a path against the forward index without raising or wrapping
+
+        Returns the parsed segments, the absolute path, and the found node or
+        attribute dictionary (None when the path names nothing). The index holds
+        every existing path, so a miss is definitive.
+        """
+        parts = _parse(path)
+        abs_path = f'{self.path}/{"/".join(parts)}' if parts else self.path
+        return parts, abs_path, self._ensure_path_indexes()._fwd.get(abs_path)
+
+    def __getitem__(self, path: str):
+        if not path or path == '/':
+            # self-reference needs no parsing, no index and no wrapper
+            return self
+        hit = self._resolved.get(path)
+        if hit is not None:
+            return hit
+        parts, abs_path, found = self._resolve_raw(path)
+        if found is not None:
+            result = found if parts and parts[-1].startswith('@') else self._wrap(found, abs_path)
+            self._resolved[path] = result
+            return result
+        # fall back to walking the raw child dictionaries, which reports exactly which
+        # path element is missing or misplaced, wrapping only the terminal node
+        node, node_path, attr = self.structure, self.path, None
+        for name in parts:
+            if attr is not None:
+                raise KeyError(f'Attribute "@..." must be the last element of the path {path}')
+            if name.startswith('@'):
+                attr = self._attrs_by_name(node).get(name[1:])
+                if attr is None:
+                    raise KeyError(f'No attribute named {name[1:]} at {node_path or "/"}')
+                continue
+            child = self._children_by_name(node).get(name)
+            if child is None:
+                raise KeyError(f'No child named {name} at {node_path or "/"}')
+            node, node_path = child, f'{node_path}/{name}'
+        result = attr if attr is not None else self._wrap(node, node_path)
+        self._resolved[path] = result
+        return result
+
+    def get(self, path: str, default=None):
+        """Like __getitem__, but return the provided default instead of raising KeyError"""
+        parts, abs_path, found = self._resolve_raw(path)
+        if found is None:
+            return default
+        return found if parts and parts[-1].startswith('@') else self._wrap(found, abs_path)
+
+    def exists(self, path: str) -> bool:
+        """Check whether the named group, dataset, link or attribute is present"""
+        return self._resolve_raw(path)[2] is not None
+
+    def resolve(self, path: str) -> tuple[bool, object]:
+        """Resolve a path in one traversal, returning (found, value)
+
+        The value is the wrapped navigator or attribute dictionary when found, and
+        None otherwise. Prefer this over separate exists() plus indexing when both
+        the presence and the value are wanted.
+        """
+        parts, abs_path, found = self._resolve_raw(path)
+        if found is None:
+            return False, None
+        return True, found if parts and parts[-1].startswith('@') else self._wrap(found, abs_path)
+
+    def get_many(self, paths, default=None) -> list:
+        """Resolve several paths in one call, in the order given
+
+        Each path costs one cached parse and one index probe; missing paths yield
+        the default. The first call amortizes the index build over the whole batch.
+        """
+        get = self.get
+        return [get(path, default) for path in paths]
+
+    def _ensure_name_index(self):
+        """Build the inverted name->[nodes] indexes for find_all, once per navigator"""
+        if self._by_name_all is not None:
+            return
+        by_name: dict[str, list[dict]] = {}
+        by_attr: dict[str, list[dict]] = {}
+        stack = deque([self.structure])
+        while stack:
+            node = stack.pop()
+            for child in node.get('children') or _EMPTY:
+                child_name = _node_name(child)
+                if child_name is not None:
+                    by_name.setdefault(child_name, []).append(child)
+                for attr in child.get('attributes') or _EMPTY:
+                    if 'name' in attr:
+                        by_attr.setdefault(attr['name'], []).append(attr)
+                stack.append(child)
+        self._by_name_all = by_name
+        self._by_attr_all = by_attr
+
+    def find_all(self, name: str, include_attributes: bool = False) -> list[dict]:
+        """Return all node (and optionally attribute) dictionaries with the given name"""
+        self._ensure_name_index()
+        found = list(self._by_name_all.get(name, []))
+        if include_attributes:
+            found.extend(self._by_attr_all.get(name, []))
+        return found
+
+    def iter_find(self, name: str, include_attributes: bool = False):
+        """Lazily yield the node (and optionally attribute) dictionaries with the given name
+
+        Served from the inverted indexes when they are already built; otherwise the
+        subtree is walked and matches yielded as they are found, so callers using
+        any() or next() can stop without visiting every node. Use find_all when the
+        complete list is wanted repeatedly.
+        """
+        if self._by_name_all is not None:
+            yield from self._by_name_all.get(name, _EMPTY)
+            if include_attributes:
+                yield from self._by_attr_all.get(name, _EMPTY)
+            return
+        stack = deque([self.structure])
+        while stack:
+            node = stack.pop()
+            for child in node.get('children') or _EMPTY:
+                if _node_name(child) == name:
+                    yield child
+                if include_attributes:
+                    for attr in child.get('attributes') or _EMPTY:
+                        if attr.get('name') == name:
+                            yield attr
+                stack.append(child)
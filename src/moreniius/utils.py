@@ -37,11 +37,12 @@ def outer_transform_dependency(transformations):
     if len(names) == 1:
         return names[0]
     def depends_on_per(name):
-        obj = getattr(transformations, name)
-        if not hasattr(obj, 'depends_on'):
+        # a single sentinel-defaulted getattr instead of hasattr + repeated attribute reads
+        depends_on = getattr(getattr(transformations, name), 'depends_on', None)
+        if depends_on is None:
             raise ValueError(f'{name} in {names} dependency chain missing "depends_on" attribute')
-        if isinstance(obj.depends_on, NXfield):
-            # obj.depends_on is an NXfield object; which has a number of properties
+        if isinstance(depends_on, NXfield):
+            # depends_on is an NXfield object; which has a number of properties
             #   nxgroup - the parent group
             #   dtype - string or numpy dtype
             #   shape - list or tuple of ints
@@ -50,9 +51,9 @@ def outer_transform_dependency(transformations):
             #   nxpath - string, where this object is in the tree
             #   nxroot - the root NXgroup object containing this object
             # I _think_ we *always* want the data stored in this object
-            return obj.depends_on.nxdata
-        elif isinstance(obj.depends_on, str):
-            return obj.depends_on
+            return depends_on.nxdata
+        elif isinstance(depends_on, str):
+            return depends_on
         raise ValueError(f"depends_on attribute of {name} is not an NXfield or str")
 
     # depends = {name: getattr(transformations, name).depends_on for name in names}
@@ -218,6 +219,18 @@ def link_specifier(name: str, source: str) -> NotNXdict:
     return ess_flatbuffer_specifier('link', {'name': name, 'source': source})
 
 
+def _link_config(par):
+    """Return the file-writer link config held by an NXfield-wrapped NotNXdict, or None
+
+    A single nxdata retrieval plus class check replaces the isinstance/isinstance/module
+    triple probe that would otherwise run for every instance parameter.
+    """
+    value = getattr(par, 'nxdata', None)
+    if value.__class__ is NotNXdict and value.value.get('module') == 'link':
+        return value.value['config']
+    return None
+
+
 def resolve_parameter_links(instance_parameters: dict):
     """Component instances have NeXus base class equivalents that require specifying any number of parameters.
     Sometimes the McCode parameters are instrument-parameters, which may only be specified at runtime.
@@ -226,9 +239,9 @@ def resolve_parameter_links(instance_parameters: dict):
     If the link is singular, it should have its name replaced by the NeXus class parameter so that NeXus programs
     recognize it correctly.
     """
-    from nexusformat.nexus import NXfield
     for name, par in instance_parameters.items():
-        if isinstance(par, NXfield) and isinstance(par.nxdata, NotNXdict) and 'link' == par.nxdata.value['module']:
-            par.nxdata.value['config']['name'] = name
+        config = _link_config(par)
+        if config is not None:
+            config['name'] = name
 
     return instance_parameters
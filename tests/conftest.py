@@ -0,0 +1,22 @@
+import pytest
+
+
+@pytest.fixture(scope='session')
+def motorized_instrument():
+    """Assemble the motorized test instrument once per session; assembly pulls
+    component definitions through the registry and is the slowest step here"""
+    from test_motorized_positions import make_motorized_instrument
+    return make_motorized_instrument()
+
+
+@pytest.fixture(scope='session')
+def motorized_nexus_structure(motorized_instrument):
+    """The NeXus Structure of the motorized instrument, built once per session
+
+    MorEniius.from_mccode and to_nexus_structure are pure functions of the
+    instrument and translation options, so every test can share one result.
+    """
+    import moreniius
+    nx = moreniius.MorEniius.from_mccode(motorized_instrument, origin='origin',
+                                         only_nx=False, absolute_depends_on=True)
+    return nx.to_nexus_structure()
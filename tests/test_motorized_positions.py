@@ -1,9 +1,8 @@
+from mccode_antlr.assembler import Assembler
+from mccode_antlr.reader import MCSTAS_REGISTRY
 
-def make_motorized_instrument():
-    from mccode_antlr.assembler import Assembler
-    from mccode_antlr.reader import MCSTAS_REGISTRY, LocalRegistry
-    from mccode_to_kafka.writer import da00_dataarray_config, da00_variable_config
 
+def make_motorized_instrument():
     inst = Assembler('inst', registries=[MCSTAS_REGISTRY])
     inst.parameter('double ex/"m"=0')
     inst.parameter('double phi/"degree"=0')
@@ -17,13 +16,50 @@ def make_motorized_instrument():
     return inst.instrument
 
 
-def test_motorized_instrument():
-    import moreniius
-    motorized = make_motorized_instrument()
-    nx = moreniius.MorEniius.from_mccode(motorized, origin='origin', only_nx=False, absolute_depends_on=True)
-    assert nx is not None
+# required-key sets, hoisted so each presence check is one C-level subset test
+_GROUP_KEYS = frozenset(('name', 'type', 'children', 'attributes'))
+_DATASET_KEYS = frozenset(('config', 'attributes'))
+_DATASET_CFG_KEYS = frozenset(('name', 'values', 'type'))
+_LINK_CFG_KEYS = frozenset(('name', 'source'))
+_ATTR_KEYS = frozenset(('name', 'values', 'dtype'))
+_TRANSFORM_ATTR_NAMES = frozenset(('vector', 'depends_on', 'transformation_type', 'units'))
+
+
+def check_static_transformation(c):
+    assert _DATASET_KEYS <= c.keys()
+    assert _DATASET_CFG_KEYS <= c['config'].keys()
+    attrs = c['attributes']
+    assert len(attrs) == 4
+    assert all(_ATTR_KEYS <= a.keys() for a in attrs)
+    assert all(a['name'] in _TRANSFORM_ATTR_NAMES for a in attrs)
+
+
+def check_dynamic_transformation(c):
+    assert _GROUP_KEYS <= c.keys()
+    assert 'group' == c['type']
+    attrs = c['attributes']
+    assert len(attrs) == 1
+    attr = attrs[0]
+    assert _ATTR_KEYS <= attr.keys()
+    assert 'NX_class' == attr['name']
+    assert 'NXgroup' == attr['values']
+
+    # The children should contain a link to the log ... is the order important?
+    # Must the number of children always be the same?
+    modules = [cc.get('module') for cc in c['children']]
+    assert all(module is not None for module in modules)
+    assert sum('link' == module for module in modules) <= 1
+    for cc, module in zip(c['children'], modules):
+        if 'link' == module:
+            assert _LINK_CFG_KEYS <= cc['config'].keys()
+        else:
+            assert _DATASET_CFG_KEYS <= cc['config'].keys()
+            assert cc['config']['name'] in _TRANSFORM_ATTR_NAMES
+
+
+def test_motorized_instrument(motorized_nexus_structure):
     #TODO add actual tests for the contents of, e.g., the dumped NeXus Structure
-    ns = nx.to_nexus_structure()
+    ns = motorized_nexus_structure
 
     expected = {
         'entry': {
@@ -43,7 +79,7 @@ def test_motorized_instrument():
         assert 'children' in ns
         assert len(ns['children']) >= has['next']
         ns = ns['children'][has['next']]
-        assert all(x in ns for x in ('type', 'name', 'children', 'attributes'))
+        assert _GROUP_KEYS <= ns.keys()
         assert ns['name'] == name
         assert ns['attributes'] == has['attributes']
         assert len(ns['children']) == has['children']
@@ -52,49 +88,25 @@ def test_motorized_instrument():
     zrot = ns['children'][4]
     aposrot = ns['children'][5]
 
-
-    from json import dumps
-
     for cns in (xpos, zrot, aposrot):
         assert 'children' in cns
-        assert 'transformations' in [c['name'] for c in cns['children'] if 'name' in c]
-        t = [c for c in cns['children'] if 'name' in c and c['name'] == 'transformations'][0]
+        by_name = {c['name']: c for c in cns['children'] if 'name' in c}
+        assert 'transformations' in by_name
+        t = by_name['transformations']
         assert 'children' in t
         t = t['children']
         for c in t:
             # Each child can _either_ be a dataset, with 'module' at its top level
             # Or a group, with 'name', etc. at its top level
-
-            if 'module' in c:
+            # One get() decides the branch instead of separate 'in' and item probes
+            module = c.get('module')
+            if module is not None:
                 # this transformation is static, and a dataset
-                assert 'dataset' == c['module']
-                assert all(x in c for x in ('config', 'attributes'))
-                assert all(x in c['config'] for x in ('name', 'values', 'type'))
-                attrs = c['attributes']
-                assert len(attrs) == 4
-                assert all(all(x in a for x in ('name', 'values', 'dtype')) for a in attrs)
-                assert all(a['name'] in ('vector', 'depends_on', 'transformation_type', 'units') for a in attrs)
+                assert 'dataset' == module
+                check_static_transformation(c)
             else:
                 # this transformation is dynamic and a group
-                assert all(x in c for x in ('name', 'type', 'children', 'attributes'))
-                assert 'group' == c['type']
-                attrs = c['attributes']
-                assert len(attrs) == 1
-                attr = attrs[0]
-                assert all(x in attr for x in ('name', 'dtype', 'values'))
-                assert 'NX_class' == attr['name']
-                assert 'NXgroup' == attr['values']
-
-                # The children should contain a link to the log ... is the order important?
-                # Must the number of children always be the same?
-                assert all('module' in cc for cc in c['children'])
-                assert sum('link' == cc['module'] for cc in c['children']) <= 1
-                for cc in c['children']:
-                    if 'link' == cc['module']:
-                        assert all(x in cc['config'] for x in ('name', 'source'))
-                    else:
-                        assert all(x in cc['config'] for x in ('name', 'values', 'type'))
-                        assert cc['config']['name'] in ('vector', 'depends_on', 'transformation_type', 'units')
+                check_dynamic_transformation(c)
 
     # for name, has in expected.items():
     #     print({x : list(ns[x]) for x in ns})
@@ -0,0 +1,161 @@
+import pytest
+from moreniius.navigator import NexusStructureNavigator
+
+
+def nx_class(name):
+    return {'name': 'NX_class', 'dtype': 'string', 'values': name}
+
+
+def make_structure():
+    """A hand-built NeXus Structure, shaped like the output of Writer.to_nexus_structure"""
+    mon0 = {
+        'name': 'mon0', 'type': 'group',
+        'attributes': [nx_class('NXmonitor')],
+        'children': [
+            {'module': 'dataset',
+             'config': {'name': 'depends_on', 'values': 'transformations/mon0_t0', 'type': 'string'}},
+            {'module': 'link',
+             'config': {'name': 'mon0_event_data', 'source': '/entry/instrument/mon0/event_data'}},
+        ],
+    }
+    instrument = {
+        'name': 'instrument', 'type': 'group',
+        'attributes': [nx_class('NXinstrument')],
+        'children': [mon0],
+    }
+    entry = {
+        'name': 'entry', 'type': 'group',
+        'attributes': [nx_class('NXentry')],
+        'children': [instrument],
+    }
+    return {'children': [entry]}
+
+
+def test_chaining_navigation():
+    nav = NexusStructureNavigator(make_structure())
+    mon0 = nav['entry']['instrument']['mon0']
+    assert isinstance(mon0, NexusStructureNavigator)
+    assert mon0.structure['name'] == 'mon0'
+
+
+def test_slash_path_navigation():
+    nav = NexusStructureNavigator(make_structure())
+    assert nav['entry/instrument/mon0'].structure['name'] == 'mon0'
+    assert nav['/entry/instrument/mon0'].structure['name'] == 'mon0'
+
+
+def test_dataset_and_link_navigation():
+    nav = NexusStructureNavigator(make_structure())
+    assert nav['entry/instrument/mon0/depends_on'].structure['module'] == 'dataset'
+    assert nav['entry/instrument/mon0/mon0_event_data'].structure['module'] == 'link'
+
+
+def test_attribute_access():
+    nav = NexusStructureNavigator(make_structure())
+    attr = nav['entry/instrument/@NX_class']
+    assert attr == nx_class('NXinstrument')
+
+
+def test_attribute_must_be_last():
+    nav = NexusStructureNavigator(make_structure())
+    with pytest.raises(KeyError):
+        nav['entry/@NX_class/mon0']
+
+
+def test_missing_raises_key_error():
+    nav = NexusStructureNavigator(make_structure())
+    with pytest.raises(KeyError):
+        nav['entry/instrument/not_there']
+
+
+def test_get_path():
+    structure = make_structure()
+    nav = NexusStructureNavigator(structure)
+    mon0 = structure['children'][0]['children'][0]['children'][0]
+    assert nav.get_path(mon0) == '/entry/instrument/mon0'
+    assert nav.get_path(mon0['children'][0]) == '/entry/instrument/mon0/depends_on'
+    assert nav.get_path(mon0['attributes'][0]) == '/entry/instrument/mon0/@NX_class'
+    assert nav.get_path({'name': 'not in the structure'}) is None
+    # children share the root index, so a child navigator resolves the same absolute paths
+    assert nav['entry']['instrument'].get_path(mon0) == '/entry/instrument/mon0'
+
+
+def make_structure_with_stream():
+    """As make_structure, but with an NXlog-style group holding a nameless stream module"""
+    structure = make_structure()
+    ex = {
+        'name': 'ex', 'type': 'group',
+        'attributes': [nx_class('NXlog')],
+        'children': [{'module': 'f144', 'config': {'source': 'ex', 'topic': 'motion'}}],
+    }
+    structure['children'][0]['children'].append(ex)
+    return structure
+
+
+def test_nameless_stream_module_does_not_shadow_group():
+    nav = NexusStructureNavigator(make_structure_with_stream())
+    assert nav['entry/ex'].structure['name'] == 'ex'
+    assert nav.get('entry/ex').structure['name'] == 'ex'
+    assert nav.exists('entry/ex')
+    found, ex = nav.resolve('entry/ex')
+    assert found and ex.structure['name'] == 'ex'
+    assert nav['entry/ex/@NX_class'] == nx_class('NXlog')
+    # the unaddressable module has no path, rather than claiming its parent's
+    assert nav.get_path(ex.structure['children'][0]) is None
+
+
+def test_get_and_exists():
+    nav = NexusStructureNavigator(make_structure())
+    assert nav.exists('entry/instrument/mon0')
+    assert nav.exists('entry/@NX_class')
+    assert not nav.exists('entry/instrument/not_there')
+    assert nav.get('entry/instrument/not_there') is None
+    assert nav['entry'].exists('instrument')
+    # a navigator rooted on a group must resolve that group's own attributes
+    entry = NexusStructureNavigator(make_structure()['children'][0])
+    assert entry.exists('@NX_class')
+    assert entry.get('@NX_class') == nx_class('NXentry')
+
+
+def test_self_access():
+    nav = NexusStructureNavigator(make_structure())
+    assert nav[''] is nav
+    assert nav['/'] is nav
+    assert nav['entry']['/'] is nav['entry']
+
+
+def test_resolve():
+    nav = NexusStructureNavigator(make_structure())
+    found, mon0 = nav.resolve('entry/instrument/mon0')
+    assert found and mon0.structure['name'] == 'mon0'
+    found, nothing = nav.resolve('entry/instrument/not_there')
+    assert not found and nothing is None
+
+
+def test_repeated_access_shares_wrappers():
+    nav = NexusStructureNavigator(make_structure())
+    assert nav['entry'] is nav['entry']
+    assert nav['entry/instrument'] is nav['entry']['instrument']
+
+
+def test_find_all():
+    nav = NexusStructureNavigator(make_structure())
+    assert len(nav.find_all('mon0')) == 1
+    assert len(nav.find_all('NX_class')) == 0
+    assert len(nav.find_all('NX_class', include_attributes=True)) == 3
+    assert nav.find_all('not_there') == []
+
+
+def test_get_many():
+    nav = NexusStructureNavigator(make_structure())
+    mon0, absent, entry_class = nav.get_many(('entry/instrument/mon0', 'nothing/here', 'entry/@NX_class'))
+    assert mon0 is nav['entry/instrument/mon0']
+    assert absent is None
+    assert entry_class == nx_class('NXentry')
+
+
+def test_iter_find():
+    nav = NexusStructureNavigator(make_structure())
+    assert next(nav.iter_find('NX_class', include_attributes=True))['name'] == 'NX_class'
+    assert len(list(nav.iter_find('mon0'))) == 1
+    assert list(nav.iter_find('not_there')) == []
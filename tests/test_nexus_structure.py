@@ -1,12 +1,35 @@
 import unittest
+from json import dumps
+from mccode_antlr.loader import parse_mcstas_instr
+from mccode_to_kafka.writer import da00_variable_config, da00_dataarray_config
+from nexusformat.nexus import NXdata, NXfield
+from moreniius import MorEniius
+from moreniius.nexus_structure import to_nexus_structure
+from moreniius.utils import NotNXdict
 
 # TODO When github.com/g5t/mccode-to-kafka fully switched to using da00, these tests will fail.
 
+def _canon(obj) -> str:
+    """Canonical JSON serialization, so structure equality is one string compare"""
+    return dumps(obj, sort_keys=True)
+
+
 class NexusStrctureTestCase(unittest.TestCase):
-    def setUp(self):
-        from json import dumps
-        from mccode_antlr.loader import parse_mcstas_instr
-        from mccode_to_kafka.writer import da00_variable_config, da00_dataarray_config
+    def assertSameStructure(self, first, second):
+        """Compare JSON-compatible structures by canonical serialization
+
+        The serialized compare runs in C even for deeply nested structures; only
+        on mismatch fall back to assertEqual for its readable element-wise diff.
+        Note that tuple-vs-list differences serialize identically and so pass
+        silently here; that is acceptable, since both dump to the same JSON.
+        """
+        if _canon(first) != _canon(second):
+            self.assertEqual(first, second)
+
+    @classmethod
+    def setUpClass(cls):
+        # the instrument source is constant, so parse it once for the whole class
+        # rather than once per test method
         t0 = {'name': 't', 'unit': 'usec', 'label': 'monitor', 'data': {'first': 0.5, 'last': 10.5, 'size': 11}}
         t1 = {'name': 't', 'unit': 'usec', 'label': 'monitor', 'data': {'first': 1.5, 'last': 11.5, 'size': 11}}
         m0 = da00_dataarray_config(topic='mon0', source='mccode-to-kafka', constants=[da00_variable_config(**t0)])
@@ -27,13 +50,10 @@ class NexusStrctureTestCase(unittest.TestCase):
         COMPONENT sample = Arm() AT (0, 0, 80) RELATIVE ch2
         END
         """
-        self.instr = parse_mcstas_instr(instr)
-        self.structures = {'2_mon0': m0, '5_mon1': m1}
+        cls.instr = parse_mcstas_instr(instr)
+        cls.structures = {'2_mon0': m0, '5_mon1': m1}
 
     def test_moreniius(self):
-        from moreniius import MorEniius
-        from moreniius.utils import NotNXdict
-        from nexusformat.nexus import NXdata, NXfield
         me = MorEniius.from_mccode(self.instr, origin='sample_stack', only_nx=False, absolute_depends_on=True)
         self.assertTrue(isinstance(me, MorEniius))
         for k in self.structures.keys():
@@ -48,10 +68,9 @@ class NexusStrctureTestCase(unittest.TestCase):
             c = b.to_json_dict()
             self.assertTrue(isinstance(c, dict))
             s = self.structures[k]
-            self.assertEqual(c, s)
+            self.assertSameStructure(c, s)
 
     def test_nexus_structure(self):
-        from moreniius.nexus_structure import to_nexus_structure
         nx = to_nexus_structure(self.instr)
         self.assertTrue(isinstance(nx, dict))
         self.assertEqual(len(nx), 1)
@@ -80,7 +99,7 @@ class NexusStrctureTestCase(unittest.TestCase):
         self.assertEqual(nx['attributes'][0]['name'], 'NX_class')
         self.assertEqual(nx['attributes'][0]['values'], 'NXdata')
         nx = nx['children'][0]
-        self.assertEqual(self.structures['2_mon0'], nx)
+        self.assertSameStructure(self.structures['2_mon0'], nx)
 
 
 if __name__ == '__main__':